@@ -41,10 +41,14 @@ def _irr2flux(ureg, x, domain):
     """
     convert from irradiance to photonflux.
     """
-    return x * domain / (
-        ureg.planck_constant
-        * ureg.speed_of_light
-        * ureg.N_A
+    # scale the (broadcastable) domain first, so that only a single
+    # operation is applied to the full-size array
+    return x * (
+        domain / (
+            ureg.planck_constant
+            * ureg.speed_of_light
+            * ureg.N_A
+        )
     )
 
 
@@ -52,12 +56,15 @@ def _flux2irr(ureg, x, domain):
     """
     cnvert from photonflux to irradiance
     """
-    return (
-        x * (
+    # scale the (broadcastable) domain first, so that only a single
+    # operation is applied to the full-size array
+    return x * (
+        (
             ureg.planck_constant
             * ureg.speed_of_light
-            * ureg.N_A)
-    ) / domain
+            * ureg.N_A
+        ) / domain
+    )
 
 
 c.add_transformation(
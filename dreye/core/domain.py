@@ -8,15 +8,64 @@ import pandas as pd
 
 from dreye.utilities import (
     is_listlike, asarray, array_domain, is_uniform,
-    optional_to, is_numeric, arange, get_value,
+    optional_to, is_numeric, get_value,
     is_integer, has_units
 )
-from dreye.utilities.abstract import inherit_docstrings
+from dreye.utilities.abstract import inherit_docstrings, cached_property
 from dreye.err import DreyeError
 from dreye.constants import DEFAULT_FLOAT_DTYPE
 from dreye.core.abstract import _UnitArray
 
 
+class _LazyUniform:
+    """
+    Uniformly spaced values that are only created when requested.
+    """
+
+    def __init__(self, start, stop, num, reverse=False,
+                 dtype=DEFAULT_FLOAT_DTYPE):
+        self.start = start
+        self.stop = stop
+        self.num = num
+        self.reverse = reverse
+        self.dtype = dtype
+
+    def __len__(self):
+        return self.num
+
+    def __getitem__(self, key):
+        if isinstance(key, slice) and key == slice(None, None, -1):
+            return type(self)(
+                self.start, self.stop, self.num,
+                not self.reverse, self.dtype
+            )
+        elif is_integer(key):
+            # compute single value the same way as `numpy.linspace`
+            idx = int(get_value(key))
+            if idx < 0:
+                idx += self.num
+            if not 0 <= idx < self.num:
+                raise IndexError(
+                    f"index {key} is out of bounds for size {self.num}"
+                )
+            if self.reverse:
+                idx = self.num - 1 - idx
+            if idx == self.num - 1:
+                return self.dtype(self.stop)
+            step = (self.stop - self.start) / (self.num - 1)
+            return self.dtype(idx * step + self.start)
+        return np.asarray(self)[key]
+
+    def __array__(self, dtype=None, copy=None):
+        values = np.linspace(
+            self.start, self.stop, self.num,
+            dtype=(self.dtype if dtype is None else dtype)
+        )
+        if self.reverse:
+            values = values[::-1]
+        return values
+
+
 @inherit_docstrings
 class Domain(_UnitArray):
     """
@@ -61,6 +110,7 @@ class Domain(_UnitArray):
         **_UnitArray._deprecated_kws,
         'interval_': '_interval_'
     }
+    _cached_attributes = ('gradient', 'span', 'boundaries')
 
     @property
     def _class_new_instance(self):
@@ -172,10 +222,13 @@ class Domain(_UnitArray):
         else:
             values = asarray(values, DEFAULT_FLOAT_DTYPE)
             assert values.ndim == 1, "Array must be 1-dimensional"
-            reverse = np.all(np.sort(values) == values[::-1])
+            diffs = np.diff(values)
+            reverse = np.all(diffs <= 0)
 
-            # check if domain is sorted
-            if not reverse and not np.all(np.sort(values) == values):
+            # check if domain is sorted (NaN fails all comparisons)
+            if np.any(np.isnan(values)) or (
+                not reverse and not np.all(diffs >= 0)
+            ):
                 raise DreyeError("Values for domain initialization "
                                  f"must be sorted: {values}.")
 
@@ -193,13 +246,23 @@ class Domain(_UnitArray):
                 reverse = interval < 0
             else:
                 # returns start and end in ascending order
+                # reuse differences instead of sorting again
                 start, end, interval = array_domain(
-                    values, uniform=is_uniform(values)
+                    (values[::-1] if reverse else values),
+                    sorted=True,
+                    uniform=is_uniform(np.abs(diffs), is_array_diff=True)
                 )
 
             # always positive interval
             interval = np.abs(interval)
 
+        self._assign_values(start, end, interval, reverse)
+
+    def _assign_values(self, start, end, interval, reverse):
+        """
+        Assign values and interval given checked `start`, `end`, and
+        positive `interval` with `start` <= `end`.
+        """
         if reverse:
             self._start, self._end = end, start
         else:
@@ -208,6 +271,35 @@ class Domain(_UnitArray):
         self._values, self._interval = self._create_values(
             start, end, interval, reverse
         )
+        self._is_uniform = is_numeric(self._interval)
+        self._invalidate_cache()
+
+    @classmethod
+    def _from_prechecked(
+        cls, start, end, interval, units,
+        attrs=None, name=None, _interval_=None
+    ):
+        """
+        Create an ascending domain from checked `start`, `end`, and
+        `interval` in `units`, without going through `__init__`.
+        """
+        self = cls.__new__(cls)
+        self._units = units
+        self.attrs = attrs
+        self.name = name
+        self._interval_ = _interval_
+        self._assign_values(
+            DEFAULT_FLOAT_DTYPE(start), DEFAULT_FLOAT_DTYPE(end),
+            DEFAULT_FLOAT_DTYPE(interval), False
+        )
+        return self
+
+    def _invalidate_cache(self):
+        """
+        Remove cached properties that depend on the `values` array.
+        """
+        for attr in self._cached_attributes:
+            self.__dict__.pop(attr, None)
 
     @staticmethod
     def _create_values(start, end, interval, reverse):
@@ -217,6 +309,9 @@ class Domain(_UnitArray):
         if is_listlike(interval):
             # TODO: dealing with tolerance
             interval = asarray(interval)
+            if np.any(interval < 0):
+                raise DreyeError('intervals must be positive: '
+                                 '{0}'.format(interval))
             interval_diff = (end - start) - np.sum(interval)
             if interval_diff > 0:
                 # warn that the sum of intervals provided is smaller
@@ -229,11 +324,16 @@ class Domain(_UnitArray):
                 raise DreyeError("Sum of intervals are larger "
                                  "than span of domain.")
 
-            values = np.append(start, start + np.cumsum(interval))
-            values = values.astype(DEFAULT_FLOAT_DTYPE)
-            interval = interval.astype(DEFAULT_FLOAT_DTYPE)
+            interval = np.ascontiguousarray(
+                interval, dtype=DEFAULT_FLOAT_DTYPE
+            )
+            values = np.empty(interval.size + 1, dtype=DEFAULT_FLOAT_DTYPE)
+            values[0] = start
+            np.cumsum(interval, out=values[1:])
+            values[1:] += start
 
-            if values.size != np.unique(values).size:
+            # zero intervals or float precision can produce equal values
+            if np.any(np.diff(values) <= 0):
                 raise DreyeError('values are non-unique: {0}'.format(values))
 
         elif is_numeric(interval):
@@ -243,8 +343,11 @@ class Domain(_UnitArray):
                 raise DreyeError(f"Interval Attribute value '{interval}' "
                                  f"bigger than span '{start-end}'.")
             else:
-                values, interval = arange(
-                    start, end, interval, dtype=DEFAULT_FLOAT_DTYPE)
+                # same number of values and interval as `arange`,
+                # but values are only created once accessed
+                num = int(np.around((interval + end - start) / interval, 0))
+                interval = (end - start) / (num - 1)
+                values = _LazyUniform(start, end, num)
             interval = DEFAULT_FLOAT_DTYPE(interval)
 
         else:
@@ -256,6 +359,45 @@ class Domain(_UnitArray):
             interval = -interval
         return values, interval
 
+    @property
+    def magnitude(self):
+        """
+        Returns :obj:`~numpy.ndarray` of values without units.
+
+        Uniform values are only created once they are requested.
+        """
+        if isinstance(self._values, _LazyUniform):
+            self._values = np.asarray(self._values)
+        return self._values
+
+    def __len__(self):
+        return len(self._values)
+
+    @property
+    def size(self):
+        """
+        Number of values in domain.
+        """
+        return len(self._values)
+
+    @property
+    def shape(self):
+        """
+        Shape of domain; always one-dimensional.
+        """
+        return (len(self._values),)
+
+    def to(self, units, *args, copy=True, **kwargs):
+        self = super().to(units, *args, copy=copy, **kwargs)
+        self._invalidate_cache()
+        return self
+
+    def __setitem__(self, key, value):
+        # ensure values are created
+        self.magnitude
+        super().__setitem__(key, value)
+        self._invalidate_cache()
+
     def _equalize(self, other):
         """
         Equalize other in order to do mathematical operations.
@@ -305,7 +447,7 @@ class Domain(_UnitArray):
         An interval is uniform, if it is numeric instead of array-like.
         """
         # if np.nan then True
-        return is_numeric(self.interval)
+        return self._is_uniform
 
     @property
     def has_interval(self):
@@ -436,19 +578,13 @@ class Domain(_UnitArray):
                              f"({start}, {end}) and boundaries "
                              f"({self.start}, {self.end}).")
 
-        if start < self.start:
-            start = self.start
-        if end > self.end:
-            end = self.end
-        if interval < self.interval:
-            interval = self.interval
+        start = max(start, self.start)
+        end = min(end, self.end)
+        interval = max(interval, self.interval)
 
-        # create domain class
-        domain = self._class_new_instance(
-            start=start,
-            end=end,
-            interval=interval,
-            units=self.units,
+        # create domain class; boundaries and interval are already checked
+        domain = self._from_prechecked(
+            start, end, interval, self.units,
             **self._init_kwargs
         )
 
@@ -537,19 +673,17 @@ class Domain(_UnitArray):
         length = get_value(length)
 
         if left:
-            add_domain = np.array([
-                self.start - (length - idx) * self.interval
-                for idx in range(length)
-            ])
+            add_domain = self.start - self.interval * np.arange(
+                length, 0, -1, dtype=DEFAULT_FLOAT_DTYPE
+            )
         else:
-            add_domain = np.array([
-                self.end + self.interval * (idx + 1)
-                for idx in range(length)
-            ])
+            add_domain = self.end + self.interval * np.arange(
+                1, length + 1, dtype=DEFAULT_FLOAT_DTYPE
+            )
         # add domain
         return self.append(add_domain, left=left)
 
-    @property
+    @cached_property
     def gradient(self):
         """
         Calculates gradient between points.
@@ -566,7 +700,7 @@ class Domain(_UnitArray):
 
         return np.gradient(self.magnitude) * self.units
 
-    @property
+    @cached_property
     def span(self):
         """
         Span of the domain (max-min).
@@ -578,7 +712,7 @@ class Domain(_UnitArray):
         """
         return np.max(self.magnitude) - np.min(self.magnitude)
 
-    @property
+    @cached_property
     def boundaries(self):
         """
         Tuple of minimum and maximum value.
@@ -67,7 +67,7 @@ class BestSubstitutionFit(IndependentExcitationFit, _RelativeMixin):
         X = asarray(X)
         if X.ndim == 1:
             self._set_required_objects()
-            X_ = np.zeros((len(X), self.photoreceptor_model_.n_opsins)).astype(bool)
+            X_ = np.zeros((len(X), self.photoreceptor_model_.n_opsins), dtype=bool)
             for idx, ix in enumerate(X):
                 X_[idx, ix] = True
             X = X_
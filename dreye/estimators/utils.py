@@ -2,10 +2,12 @@
 Utility functions
 """
 
-from itertools import combinations, product
+from itertools import combinations, product, chain
+from weakref import WeakKeyDictionary
 import numpy as np
+from scipy.special import comb
 
-from dreye.constants import ureg
+from dreye.constants import ureg, DEFAULT_FLOAT_DTYPE
 from dreye.core.spectral_measurement import MeasuredSpectraContainer
 from dreye.core.photoreceptor import Photoreceptor, create_photoreceptor_model
 from dreye.utilities.common import (
@@ -18,6 +20,21 @@ from dreye.core.spectrum_utils import create_spectrum
 from dreye.utilities.array import asarray
 
 
+# whether `ints_to_spectra` of a measured spectra object accepts
+# the interpolation keywords of `scipy.interpolate.interp1d`
+_BG_INT_ACCEPTS_KWARGS = WeakKeyDictionary()
+
+# estimator class loaded on first use to avoid a circular import
+_IndependentExcitationFit = None
+
+
+def _get_iefit():
+    global _IndependentExcitationFit
+    if _IndependentExcitationFit is None:
+        from dreye import IndependentExcitationFit
+        _IndependentExcitationFit = IndependentExcitationFit
+    return _IndependentExcitationFit
+
 
 def check_measured_spectra(
     measured_spectra,
@@ -180,12 +197,25 @@ def get_background_from_bg_ints(bg_ints, measured_spectra):
     """
     # sanity check
     assert measured_spectra.normalized_spectra.domain_axis == 0
-    try:
-        # assume scipy.interpolate.interp1d
+    accepts_kwargs = _BG_INT_ACCEPTS_KWARGS.get(measured_spectra, None)
+    if accepts_kwargs is None:
+        # probe once per measured spectra object
+        try:
+            # assume scipy.interpolate.interp1d
+            background = measured_spectra.ints_to_spectra(
+                bg_ints, bounds_error=False, fill_value='extrapolate'
+            )
+            accepts_kwargs = True
+        except TypeError:
+            background = measured_spectra.ints_to_spectra(bg_ints)
+            accepts_kwargs = False
+        _BG_INT_ACCEPTS_KWARGS[measured_spectra] = accepts_kwargs
+        return background
+    elif accepts_kwargs:
         return measured_spectra.ints_to_spectra(
             bg_ints, bounds_error=False, fill_value='extrapolate'
         )
-    except TypeError:
+    else:
         return measured_spectra.ints_to_spectra(bg_ints)
 
 
@@ -200,22 +230,22 @@ def get_bg_ints(bg_ints, measured_spectra, rtype=None):
     else:  # relative types
         default = 1
 
+    nled = len(measured_spectra)
     # set background intensities to default
     if bg_ints is None:
-        bg_ints = np.ones(len(measured_spectra)) * default
-    elif is_numeric(bg_ints):
-        bg_ints = np.ones(
-            len(measured_spectra)
-        ) * optional_to(bg_ints, measured_spectra.intensities.units)
+        return np.full(nled, default, dtype=DEFAULT_FLOAT_DTYPE)
+
+    units = measured_spectra.intensities.units
+    if is_numeric(bg_ints):
+        bg_ints = np.full(
+            nled, optional_to(bg_ints, units), dtype=DEFAULT_FLOAT_DTYPE
+        )
     else:
         if is_dictlike(bg_ints):
             names = measured_spectra.names
             bg_ints = [bg_ints.get(name, default) for name in names]
-        bg_ints = optional_to(
-            bg_ints,
-            measured_spectra.intensities.units
-        )
-        assert len(bg_ints) == len(measured_spectra)
+        bg_ints = optional_to(bg_ints, units)
+        assert len(bg_ints) == nled
         assert np.all(bg_ints >= 0)
     return bg_ints
 
@@ -245,12 +275,10 @@ def estimate_bg_ints_from_background(
     """
     Estimate background intensity for light sources given a background spectrum to fit to.
     """
-    # internal import required here
-    from dreye import IndependentExcitationFit
     # fit background and assign bg_ints_
     # build estimator
     # if subclasses should still use this fitting procedure
-    est = IndependentExcitationFit(
+    est = _get_iefit()(
         photoreceptor_model=photoreceptor_model,
         fit_weights=fit_weights,
         background=background,
@@ -275,12 +303,13 @@ def estimate_bg_ints_from_background(
 
 
 def get_source_idcs_from_k(n, k):
-    idcs = np.array(list(combinations(np.arange(n), k)))
-    source_idcs = np.zeros((len(idcs), n)).astype(bool)
-    source_idcs[
-        np.repeat(np.arange(len(idcs)), k),
-        idcs.ravel()
-    ] = True
+    ncombos = comb(n, k, exact=True)
+    idcs = np.fromiter(
+        chain.from_iterable(combinations(range(n), k)),
+        dtype=np.intp, count=ncombos * k
+    ).reshape(ncombos, k)
+    source_idcs = np.zeros((ncombos, n), dtype=bool)
+    np.put_along_axis(source_idcs, idcs, True, axis=1)
     return source_idcs
 
 
@@ -292,7 +321,8 @@ def get_source_idcs(names, combos):
             n, combos
         )
     elif is_listlike(combos):
-        combos = asarray(combos).astype(int)
+        # check for strings before casting
+        combos = asarray(combos)
         if combos.ndim == 1:
             if is_string(combos[0]):  # if first element is string all should be
                 source_idcs = np.array([
@@ -300,11 +330,15 @@ def get_source_idcs(names, combos):
                     for source_idx in combos
                 ])
             else:  # else assume it is a list of ks
-                source_idcs = []
-                for k in combos:
-                    source_idx = get_source_idcs_from_k(n, k)
-                    source_idcs.append(source_idx)
-                source_idcs = np.vstack(source_idcs)
+                ks = combos.astype(int)
+                sizes = [comb(n, k, exact=True) for k in ks]
+                source_idcs = np.empty((sum(sizes), n), dtype=bool)
+                offset = 0
+                for k, size in zip(ks, sizes):
+                    source_idcs[offset:offset+size] = get_source_idcs_from_k(
+                        n, k
+                    )
+                    offset += size
         elif combos.ndim == 2:
             source_idcs = combos.astype(bool)
         else:
@@ -321,26 +355,39 @@ def get_source_idcs(names, combos):
     return source_idcs
 
 
-def get_source_idx(names, source_idx, asbool=False):
+def get_source_idx(names, source_idx, asbool=False, packed=False):
+    """
+    Get integer or boolean indices of light sources.
+
+    If `packed` is True, the boolean mask is returned packed into
+    bits using `numpy.packbits` with little bit order.
+    """
     if is_string(source_idx):
         source_idx = [
             names.index(name)
             for name in source_idx.split('+')
         ]
     source_idx = asarray(source_idx)
-    if source_idx.dtype == np.bool and not asbool:
+    asbool = asbool or packed
+    if source_idx.dtype == np.bool_ and not asbool:
         source_idx = np.flatnonzero(source_idx)
-    elif asbool and source_idx.dtype != np.bool:
-        _source_idx = np.zeros(len(names)).astype(bool)
+    elif asbool and source_idx.dtype != np.bool_:
+        _source_idx = np.zeros(len(names), dtype=bool)
         _source_idx[source_idx] = True
-        source_idx = source_idx
+        source_idx = _source_idx
+    if packed:
+        source_idx = np.packbits(source_idx, bitorder='little')
     return source_idx
 
 
-def get_source_idx_string(names, source_idx):
+def get_source_idx_string(names, source_idx, packed=False):
     if is_string(source_idx):
         return source_idx
     source_idx = asarray(source_idx)
+    if packed:
+        source_idx = np.unpackbits(
+            source_idx, count=len(names), bitorder='little'
+        ).astype(bool)
     return '+'.join(asarray(names)[source_idx])
 
 
@@ -353,19 +400,26 @@ def get_spanning_intensities(
     Get intensities given intensity bounds that span 
     capture space appropriately.
     """
-    n = len(intensity_bounds[0])
-    samples = np.array(list(product(*([[0, 1]] * n)))).astype(float)
-    samples *= (intensity_bounds[1] - intensity_bounds[0]) + intensity_bounds[0]
+    lower = asarray(intensity_bounds[0])
+    upper = asarray(intensity_bounds[1])
+    n = len(lower)
+    samples = np.array(list(product([0.0, 1.0], repeat=n)))
+    samples = samples * (upper - lower) + lower
     if compute_ratios:
-        samples_ = []
-        for (idx, isample), (jdx, jsample) in zip(enumerate(samples), enumerate(samples)):
-            if idx >= jdx:
-                continue
-            s_ = (ratios[:, None] * isample) + ((1-ratios[:, None]) * jsample)
-            samples_.append(s_)
-        samples_ = np.vstack(samples_)
+        # mix all pairs of samples (i < j) for each ratio;
+        # ratios of 0 and 1 only reproduce the corners
+        idcs, jdcs = np.triu_indices(len(samples), k=1)
+        ratios = asarray(ratios)
+        ratios = ratios[(ratios > 0) & (ratios < 1)]
+        pairs = np.stack([samples[idcs], samples[jdcs]], axis=1)
+        weights = np.stack([ratios, 1 - ratios], axis=1)
+        samples_ = np.einsum('rk,pkn->rpn', weights, pairs).reshape(-1, n)
         samples = np.vstack([samples, samples_])
-    samples = np.unique(samples, axis=0)
+        # mixes of different pairs can still coincide
+        samples = np.unique(samples, axis=0)
+    elif not np.all(upper > lower):
+        # corners are already unique and sorted otherwise
+        samples = np.unique(samples, axis=0)
     return samples
 
 
@@ -395,16 +449,18 @@ def get_optimal_capture_samples(
         isolating_captures = model.fitted_capture_X_
         captures = np.vstack([captures, isolating_captures])
         if compute_ratios:
-            qs = []
-            for idx, jdx in zip(range(photoreceptor_model.n_opsins), range(photoreceptor_model.n_opsins)):
-                if idx >= jdx:
-                    continue
-                qs_ = (
-                    isolating_captures[idx] * ratios[:, None] 
-                    + isolating_captures[jdx] * (1-ratios[:, None])
-                )
-                qs.append(qs_)
-            qs = np.vstack(qs)
+            # mix all pairs of isolating captures (i < j) for each ratio
+            idcs, jdcs = np.triu_indices(photoreceptor_model.n_opsins, k=1)
+            ratios = asarray(ratios)
+            # ratios of 0 and 1 only reproduce the isolating captures
+            ratios = ratios[(ratios > 0) & (ratios < 1)]
+            pairs = np.stack(
+                [isolating_captures[idcs], isolating_captures[jdcs]], axis=1
+            )
+            weights = np.stack([ratios, 1 - ratios], axis=1)
+            qs = np.einsum('rk,pkn->rpn', weights, pairs).reshape(
+                -1, isolating_captures.shape[1]
+            )
             captures = np.vstack([captures, qs])
         captures = np.unique(captures, axis=0)
     return captures
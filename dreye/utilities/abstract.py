@@ -8,6 +8,26 @@ from inspect import getmembers, isfunction, signature
 
 from dreye.err import DreyeError
 
+try:
+    from functools import cached_property
+except ImportError:  # python < 3.8
+    class cached_property:
+        """
+        Property whose value is computed once and then stored on the instance.
+        """
+
+        def __init__(self, func):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = self.func(instance)
+            instance.__dict__[self.attrname] = value
+            return value
+
 
 def inherit_docstrings(cls):
     """
@@ -27,6 +27,23 @@ class TestDomain:
         with raises(err.DreyeError):
             # non-unique
             dreye.Domain([0.1, 0.1, 0.2, 0.2, 0.3, 0.3], units='s')
+        with raises(err.DreyeError):
+            # unsorted
+            dreye.Domain([0.1, 0.3, 0.2], units='s')
+        with raises(err.DreyeError):
+            # non-unique in float precision
+            dreye.Domain(1e16, 1e16 + 4, [1., 1., 1., 1.], units='s')
+        with raises(err.DreyeError):
+            # negative intervals
+            dreye.Domain._create_values(
+                0., 1., np.array([0.5, -0.2, 0.7]), False
+            )
+        # NaN values are never sorted
+        for values in (
+            [np.nan, 1, 2], [0, 1, np.nan], [0, np.nan, 1], [np.nan]
+        ):
+            with raises(err.DreyeError):
+                dreye.Domain(values, interval=1, units='s')
         # reverse domain allowed
         self.domain_reverse = dreye.Domain([0.4, 0.3, 0.2], units='s')
         assert isinstance(self.domain_reverse, dreye.Domain)
@@ -58,6 +75,12 @@ class TestDomain:
         self.test_init()
         assert self.domain1.to('ms') != self.domain1
         assert self.domain1.to('ms').units == dreye.ureg('ms').units
+        # cached attributes follow in-place unit conversion
+        domain = self.domain1.copy()
+        assert domain.span == 1.5
+        domain.units = 'ms'
+        assert domain.span == 1500
+        assert domain.gradient.units == dreye.ureg('ms').units
 
     def test_attributes(self):
         self.test_init()
@@ -103,3 +126,16 @@ class TestDomain:
     def test_extend(self):
         domain = dreye.Domain(0, 1, 0.1, units='s')
         assert domain[:1].extend(10) == domain
+
+    def test_lazy_uniform(self):
+        from dreye.core.domain import _LazyUniform
+        lazy = _LazyUniform(-0.5, 1.0, 16)
+        values = np.asarray(lazy)
+        assert np.array_equal(values, np.linspace(-0.5, 1.0, 16))
+        for idx in (0, 3, 15, -1, -16):
+            assert lazy[idx] == values[idx]
+            assert lazy[::-1][idx] == values[::-1][idx]
+        assert np.array_equal(lazy[np.array([0, 2])], values[[0, 2]])
+        assert np.array_equal(lazy[1:4], values[1:4])
+        with raises(IndexError):
+            lazy[16]
@@ -0,0 +1,80 @@
+"""Test estimators and estimator utilities
+"""
+
+import numpy as np
+
+from .context import dreye
+from dreye.estimators.utils import (
+    get_spanning_intensities, get_source_idcs,
+    get_source_idx, get_source_idx_string
+)
+
+
+class TestEstimatorUtils:
+
+    def test_spanning_intensities(self):
+        # corners are scaled into the bounds
+        samples = get_spanning_intensities(([1., 2.], [3., 5.]))
+        assert np.array_equal(
+            samples, [[1., 2.], [1., 5.], [3., 2.], [3., 5.]]
+        )
+        # duplicate corners are removed if bounds are equal
+        samples = get_spanning_intensities(([1., 2.], [1., 5.]))
+        assert np.array_equal(samples, [[1., 2.], [1., 5.]])
+        # all pairs of corners are mixed
+        samples = get_spanning_intensities(
+            ([0., 0.], [1., 1.]), ratios=np.array([0., 0.5, 1.]),
+            compute_ratios=True
+        )
+        grid = np.array([0., 0.5, 1.])
+        expected = np.stack(np.meshgrid(grid, grid, indexing='ij'), -1)
+        assert np.array_equal(samples, expected.reshape(-1, 2))
+        # default ratios with non-zero lower bounds
+        samples = get_spanning_intensities(
+            ([1., 1.], [2., 3.]), compute_ratios=True
+        )
+        assert len(samples) == len(np.unique(samples, axis=0))
+        assert np.all(samples >= np.array([1., 1.]) - 1e-10)
+        assert np.all(samples <= np.array([2., 3.]) + 1e-10)
+        assert np.any(np.all(np.isclose(samples, [1.5, 2.]), axis=1))
+
+    def test_source_idcs(self):
+        names = ['a', 'b', 'c']
+        # strings
+        source_idcs = get_source_idcs(names, ['a+b', 'c'])
+        assert np.array_equal(
+            source_idcs, [[True, True, False], [False, False, True]]
+        )
+        # single k
+        source_idcs = get_source_idcs(names, 2)
+        assert source_idcs.dtype == bool
+        assert np.array_equal(
+            source_idcs, [[1, 1, 0], [1, 0, 1], [0, 1, 1]]
+        )
+        # list of ks
+        source_idcs = get_source_idcs(names, [1, 3])
+        assert np.array_equal(
+            source_idcs, [[1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 1]]
+        )
+        # two-dimensional
+        source_idcs = get_source_idcs(names, [[1, 0, 1]])
+        assert np.array_equal(source_idcs, [[True, False, True]])
+        # k larger than number of sources
+        assert get_source_idcs(names, 4).shape == (0, 3)
+
+    def test_source_idx(self):
+        names = ['a', 'b', 'c']
+        # integer and string indices converted to boolean mask
+        for source_idx in ([0, 2], 'a+c'):
+            mask = get_source_idx(names, source_idx, asbool=True)
+            assert mask.dtype == bool
+            assert np.array_equal(mask, [True, False, True])
+        # boolean mask converted to integer indices
+        assert np.array_equal(
+            get_source_idx(names, [True, False, True]), [0, 2]
+        )
+        # packed masks
+        packed = get_source_idx(names, 'a+c', packed=True)
+        assert packed.dtype == np.uint8
+        assert get_source_idx_string(names, packed, packed=True) == 'a+c'
+        assert get_source_idx_string(names, [0, 2]) == 'a+c'
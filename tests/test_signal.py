@@ -45,6 +45,20 @@ class TestSignal:
 
     def test_conversion(self):
         self.test_init()
+        # irradiance to photonflux and back
+        wls = np.arange(300, 701, 10.)
+        irr = np.random.random((wls.size, 3))
+        signals = dreye.Signals(
+            irr, wls, domain_units='nm', units='spectralirradiance'
+        )
+        flux = signals.to('uE')
+        expected = irr * wls[:, None] * 1e-9 / (
+            6.62607015e-34 * 299792458 * 6.02214076e23
+        ) * 1e6
+        assert np.allclose(flux.magnitude, expected)
+        assert np.allclose(
+            flux.to('spectralirradiance').magnitude, irr
+        )
 
     def test_attributes(self):
         self.test_init()